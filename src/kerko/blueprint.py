@@ -15,6 +15,8 @@ class Blueprint(BaseBlueprint):
         jinja2.register_globals(self)
         self._add_core_urls()
         self._add_page_urls(app.config)
+        if "kerko_composer" in app.config:
+            app.config["kerko_composer"].warmup()
         super().register(app, options)
 
     def _add_core_urls(self) -> None:
@@ -1,5 +1,4 @@
-import pprint
-from datetime import datetime
+import time
 from typing import Any
 
 import click
@@ -10,17 +9,17 @@ from flask.cli import with_appcontext
 
 from kerko.config_helpers import is_toml_serializable
 from kerko.storage import SchemaError, SearchIndexError, delete_storage, get_doc_count
-from kerko.sync import zotero
-from kerko.sync.attachments import delete_attachments, sync_attachments
-from kerko.sync.cache import sync_cache
-from kerko.sync.index import sync_index
+
+_CACHE_TARGETS = frozenset(["everything", "cache"])
+_INDEX_TARGETS = frozenset(["everything", "index"])
+_ATTACHMENTS_TARGETS = frozenset(["everything", "attachments"])
 
 
 @wrapt.decorator
 def execution_time_logger(wrapped, _instance, args, kwargs):
-    start_time = datetime.now()
+    start_time = time.perf_counter()
     return_value = wrapped(*args, **kwargs)
-    current_app.logger.info(_format_elapsed_time(start_time))
+    current_app.logger.info(_format_elapsed_time(time.perf_counter() - start_time))
     return return_value
 
 
@@ -54,12 +53,18 @@ def sync(target, full=False):
 
     By default, everything is synchronized.
     """
+    # Sync modules pull in the Zotero client library, hence they are imported
+    # only when needed to keep the startup of unrelated `flask` commands fast.
+    from kerko.sync.attachments import sync_attachments
+    from kerko.sync.cache import sync_cache
+    from kerko.sync.index import sync_index
+
     try:
-        if target in ["everything", "cache"]:
+        if target in _CACHE_TARGETS:
             sync_cache(full)
-        if target in ["everything", "index"]:
+        if target in _INDEX_TARGETS:
             sync_index(full)
-        if target in ["everything", "attachments"]:
+        if target in _ATTACHMENTS_TARGETS:
             sync_attachments(full)
     except SearchIndexError as e:
         current_app.logger.error(e)
@@ -82,11 +87,13 @@ def clean(target):
     Use the argument to select which data to delete, either the cache, the
     search index, the attachments, or all of those (everything).
     """
-    if target in ["everything", "cache"]:
+    from kerko.sync.attachments import delete_attachments
+
+    if target in _CACHE_TARGETS:
         delete_storage("cache")
-    if target in ["everything", "index"]:
+    if target in _INDEX_TARGETS:
         delete_storage("index")
-    if target in ["everything", "attachments"]:
+    if target in _ATTACHMENTS_TARGETS:
         delete_attachments()
 
 
@@ -184,6 +191,10 @@ def zotero_item(item_key):
     WARNING: This command is provided for development purposes only and may be
     modified or removed from the module at any time.
     """
+    import pprint
+
+    from kerko.sync import zotero
+
     credentials = zotero.init_zotero()
     click.echo(pprint.pformat(zotero.load_item(credentials, item_key)))
 
@@ -197,6 +208,10 @@ def zotero_item_types():
     WARNING: This command is provided for development purposes only and may be
     modified or removed from the module at any time.
     """
+    import pprint
+
+    from kerko.sync import zotero
+
     credentials = zotero.init_zotero()
     click.echo(pprint.pformat(zotero.load_item_types(credentials)))
 
@@ -210,6 +225,10 @@ def zotero_item_fields():
     WARNING: This command is provided for development purposes only and may be
     modified or removed from the module at any time.
     """
+    import pprint
+
+    from kerko.sync import zotero
+
     credentials = zotero.init_zotero()
     click.echo(pprint.pformat(zotero.load_item_fields(credentials)))
 
@@ -224,6 +243,10 @@ def zotero_item_type_fields(item_type):
     WARNING: This command is provided for development purposes only and may be
     modified or removed from the module at any time.
     """
+    import pprint
+
+    from kerko.sync import zotero
+
     credentials = zotero.init_zotero()
     click.echo(pprint.pformat(zotero.load_item_type_fields(credentials, item_type)))
 
@@ -238,6 +261,10 @@ def zotero_item_type_creator_types(item_type):
     WARNING: This command is provided for development purposes only and may be
     modified or removed from the module at any time.
     """
+    import pprint
+
+    from kerko.sync import zotero
+
     credentials = zotero.init_zotero()
     click.echo(pprint.pformat(zotero.load_item_type_creator_types(credentials, item_type)))
 
@@ -251,15 +278,16 @@ def zotero_top_level_collections():
     WARNING: This command is provided for development purposes only and may be
     modified or removed from the module at any time.
     """
+    from kerko.sync import zotero
+
     credentials = zotero.init_zotero()
     collections = zotero.Collections(credentials, top_level=True)
     for c in collections:
         click.echo(f"{c.get('key')} {c.get('data', {}).get('name', '')}")
 
 
-def _format_elapsed_time(start_time):
-    elapsed_time = int(round((datetime.now() - start_time).total_seconds()))
-    elapsed_min, elapsed_sec = elapsed_time // 60, elapsed_time % 60
+def _format_elapsed_time(elapsed_time):
+    elapsed_min, elapsed_sec = divmod(int(round(elapsed_time)), 60)
     s = "Execution time:"
     if elapsed_min > 0:
         s += (" {n} minutes" if elapsed_min > 1 else " {n} minute").format(n=elapsed_min)
@@ -1,11 +1,13 @@
+import functools
 import re
-from typing import Dict
+from operator import attrgetter
+from typing import Any, Dict, Optional, Pattern, Tuple
 
 from flask import Config
 from flask_babel import lazy_gettext as _
-from whoosh.analysis import CharsetFilter, LowercaseFilter, StemFilter
+from whoosh.analysis import Analyzer, CharsetFilter, LowercaseFilter, StemFilter
 from whoosh.analysis.tokenizers import RegexTokenizer
-from whoosh.fields import BOOLEAN, DATETIME, ID, NUMERIC, STORED, TEXT, Schema
+from whoosh.fields import BOOLEAN, DATETIME, ID, NUMERIC, STORED, TEXT, FieldType, Schema
 from whoosh.query import Prefix, Term
 from whoosh.support.charset import accent_map
 from whoosh.util.text import rcompile
@@ -30,6 +32,327 @@ from kerko.specs import (
     TreeFacetSpec,
 )
 
+# When combining multiple strings into a single text field, the last
+# token of each string becomes adjacent to the first token of the next
+# string. This may cause phrase searches to match those tokens as if
+# they were neighbors, even though they were not in the source data. To
+# prevent this, we join the strings with the record separator character
+# and treat that character as a token. This solution is imperfect,
+# however, as the issue may still arise when a slop factor is applied to
+# the phrase search.
+_TOKEN_PATTERN = rcompile(r"\w+(\.?\w+)*|" + re.escape(extractors.RECORD_SEPARATOR))
+
+
+# Matches DOI, ISBN and ISSN lines in Zotero's Extra field.
+_ALTERNATE_ID_IN_EXTRA_RE = re.compile(
+    r"^\s*(DOI|ISBN|ISSN):\s*(\S+)\s*$", re.IGNORECASE | re.MULTILINE
+)
+
+# Field types with fixed settings, shared by all the fields that use them. Whoosh
+# field types hold no per-field state (see `Composer._id_field_type()`).
+_ID_STORED = ID(stored=True)
+_SORTABLE_TEXT = TEXT(phrase=False, sortable=True)
+_SORTABLE_NUMERIC = NUMERIC(sortable=True)
+
+
+@functools.lru_cache(maxsize=8)
+def _build_analyzers(whoosh_language: str) -> Tuple[Analyzer, Analyzer]:
+    """
+    Return the text and name analyzers for the given language.
+
+    The analyzers depend only on the language, hence they are built once and
+    shared by all `Composer` instances.
+    """
+    # Replace the standard analyzer with one that has no stop words (helping
+    # people who do phrase searches without specifying actual phrase queries).
+    text_chain = (
+        RegexTokenizer(expression=_TOKEN_PATTERN)
+        | StemFilter(lang=whoosh_language)
+        | CharsetFilter(accent_map)
+        | LowercaseFilter()
+    )
+
+    # Same for names, but without stemming.
+    name_chain = (
+        RegexTokenizer(expression=_TOKEN_PATTERN) | CharsetFilter(accent_map) | LowercaseFilter()
+    )
+    return text_chain, name_chain
+
+
+@functools.lru_cache(maxsize=32)
+def _compile_re(pattern: str) -> Optional[Pattern]:
+    """
+    Compile a regular expression pattern, or return `None` if it is empty.
+
+    Compiled patterns are cached, hence the fields and facets that are
+    configured with the same pattern share the same compiled object.
+    """
+    return re.compile(pattern) if pattern else None
+
+
+# Note: Default labels are defined here rather than in config so that they are translatable.
+
+# Used as both the selector label and the breadbox label.
+_SCOPE_LABELS = {
+    "all": _("Everywhere"),
+    "creator": _("In authors or contributors"),
+    "title": _("In titles"),
+    "pubyear": _("In publication years"),
+    "metadata": _("In all fields"),
+    "fulltext": _("In documents"),
+}
+_SCOPE_HELP_TEXTS = {
+    "all": _(
+        "Search your keywords in all bibliographic record fields "
+        "and in the text content of the available documents."
+    ),
+    "creator": _("Search your keywords in author or contributor names."),
+    "title": _("Search your keywords in titles."),
+    "pubyear": _(
+        "Search a specific publication year (you may use the <strong>%(or_op)s</strong> "
+        "operator with your keywords to find records having different publication years, "
+        "e.g., <code>2020 %(or_op)s 2021</code>).",
+        or_op=_("OR"),
+    ),
+    "metadata": _("Search your keywords in all bibliographic record fields."),
+    "fulltext": _("Search your keywords in the text content of the available documents."),
+}
+
+_FACET_DEFAULT_TITLES = {
+    "tag": _("Topic"),
+    "item_type": _("Resource type"),
+    "year": _("Publication year"),
+    "language": _("Resource language"),
+    "link": _("Online resource"),
+}
+
+_SORT_DEFAULT_LABELS = {
+    "score": _("Relevance"),
+    "date_desc": _("Newest first"),
+    "date_asc": _("Oldest first"),
+    "author_asc": _("Author A-Z"),
+    "author_desc": _("Author Z-A"),
+    "title_asc": _("Title A-Z"),
+    "title_desc": _("Title Z-A"),
+}
+
+_BIB_FORMAT_DEFAULT_LABELS = {
+    "ris": _("RIS"),
+    "bibtex": _("BibTeX"),
+}
+_BIB_FORMAT_DEFAULT_HELP_TEXTS = {
+    "ris": _("Recommended format for most reference management software"),
+    "bibtex": _("Recommended format for BibTeX-specific software"),
+}
+
+_RELATION_DEFAULT_LABELS = {
+    "cites": _("Cites"),
+    "isCitedBy": _("Cited by"),
+    "related": _("Related"),
+}
+
+# TODO: Refactor facet using factory methods in the models, as in init_link_groups().
+
+
+def _build_tag_facet(facet_key, facet_config, kwargs, *, include_re, exclude_re) -> FacetSpec:
+    return FlatFacetSpec(
+        key=f"facet_{facet_key}",
+        field_type=_ID_STORED,
+        extractor=extractors.TagsFacetExtractor(include_re=include_re, exclude_re=exclude_re),
+        codec=codecs.BaseFacetCodec(),
+        title=facet_config.get("title") or _FACET_DEFAULT_TITLES["tag"],
+        missing_label=None,  # TODO:config: Allow in config.
+        allow_overlap=True,
+        query_class=Term,
+        **kwargs,
+    )
+
+
+def _build_item_type_facet(facet_key, facet_config, kwargs) -> FacetSpec:
+    return FlatFacetSpec(
+        key=f"facet_{facet_key}",
+        field_type=_ID_STORED,
+        extractor=extractors.ItemTypeFacetExtractor(),
+        codec=codecs.ItemTypeFacetCodec(),
+        title=facet_config.get("title") or _FACET_DEFAULT_TITLES["item_type"],
+        missing_label=None,  # TODO:config: Allow in config.
+        allow_overlap=False,
+        query_class=Prefix,
+        **kwargs,
+    )
+
+
+def _build_year_facet(facet_key, facet_config, kwargs) -> FacetSpec:
+    return TreeFacetSpec(
+        key=f"facet_{facet_key}",
+        field_type=_ID_STORED,
+        extractor=extractors.YearFacetExtractor(),
+        codec=codecs.YearTreeFacetCodec(),
+        title=facet_config.get("title") or _FACET_DEFAULT_TITLES["year"],
+        missing_label=_("Unknown"),  # TODO:config: Allow in config.
+        allow_overlap=True,
+        query_class=Prefix,
+        **kwargs,
+    )
+
+
+def _build_language_facet(facet_key, facet_config, kwargs) -> FacetSpec:
+    return LanguageFacetSpec(
+        key=f"facet_{facet_key}",
+        title=facet_config.get("title") or _FACET_DEFAULT_TITLES["language"],
+        missing_label=None,  # TODO:config: Allow in config.
+        **kwargs,
+    )
+
+
+def _build_link_facet(facet_key, facet_config, kwargs) -> FacetSpec:
+    return FlatFacetSpec(
+        key=f"facet_{facet_key}",
+        field_type=BOOLEAN(stored=True),
+        extractor=extractors.ItemDataLinkFacetExtractor(key="url"),
+        codec=codecs.BooleanFacetCodec(),
+        title=facet_config.get("title") or _FACET_DEFAULT_TITLES["link"],
+        missing_label=None,
+        allow_overlap=False,
+        query_class=Term,
+        **kwargs,
+    )
+
+
+def _build_collection_facet(facet_key, facet_config, kwargs) -> FacetSpec:
+    return CollectionFacetSpec(
+        key=f"facet_{facet_key}",
+        title=facet_config["title"],
+        missing_label=None,  # TODO:config: Allow in config.
+        **kwargs,
+    )
+
+
+# Facet config settings that are not passed as is to the facet specs.
+_FACET_CONFIG_NON_KWARGS = frozenset(["enabled", "title", "type"])
+
+# Facet builders, keyed by facet type. The tag facet builder, which depends on the
+# tag patterns, gets bound to them by `Composer.init_facets()`.
+_FACET_BUILDERS = {
+    "item_type": _build_item_type_facet,
+    "year": _build_year_facet,
+    "language": _build_language_facet,
+    "link": _build_link_facet,
+    "collection": _build_collection_facet,
+}
+
+
+def _score_allowed(criteria) -> bool:
+    # Sort by score is only possible on keyword search.
+    return criteria.has_keywords()
+
+
+def _build_score_sort(sort_key, sort_config, fields) -> SortSpec:  # noqa: ARG001
+    return SortSpec(
+        key=sort_key,
+        label=sort_config.get("label") or _SORT_DEFAULT_LABELS[sort_key],
+        weight=sort_config["weight"],
+        fields=None,
+        is_allowed=_score_allowed,
+    )
+
+
+def _build_fields_sort(sort_key, sort_config, fields, *, field_keys, reverse=False) -> SortSpec:
+    return SortSpec(
+        key=sort_key,
+        label=sort_config.get("label") or _SORT_DEFAULT_LABELS[sort_key],
+        weight=sort_config["weight"],
+        fields=tuple(fields[field_key] for field_key in field_keys),
+        reverse=reverse,
+    )
+
+
+# Field keys and per-field reverse settings shared by the sort builders.
+_SORT_BY_DATE = ("sort_date", "sort_creator", "sort_title")
+_SORT_BY_CREATOR = ("sort_creator", "sort_title", "sort_date")
+_SORT_BY_TITLE = ("sort_title", "sort_creator", "sort_date")
+_REVERSE_DESC = (True, False, False)
+
+# Sort builders, keyed by sort key.
+_SORT_BUILDERS = {
+    "score": _build_score_sort,
+    "date_desc": functools.partial(
+        _build_fields_sort, field_keys=_SORT_BY_DATE, reverse=_REVERSE_DESC
+    ),
+    "date_asc": functools.partial(_build_fields_sort, field_keys=_SORT_BY_DATE),
+    "author_asc": functools.partial(_build_fields_sort, field_keys=_SORT_BY_CREATOR),
+    "author_desc": functools.partial(
+        _build_fields_sort, field_keys=_SORT_BY_CREATOR, reverse=_REVERSE_DESC
+    ),
+    "title_asc": functools.partial(_build_fields_sort, field_keys=_SORT_BY_TITLE),
+    "title_desc": functools.partial(
+        _build_fields_sort, field_keys=_SORT_BY_TITLE, reverse=_REVERSE_DESC
+    ),
+}
+
+
+# Bib format config settings that are passed as is to `BibFormatSpec`.
+_BIB_FORMAT_CONFIG_KWARGS = frozenset(["weight", "extension", "mime_type"])
+
+
+def _build_ris_bib_format(format_key, format_config, kwargs, fields) -> BibFormatSpec:
+    return BibFormatSpec(
+        key=format_key,
+        field=fields["ris"],
+        label=format_config.get("label") or _BIB_FORMAT_DEFAULT_LABELS["ris"],
+        help_text=format_config.get("help_text") or _BIB_FORMAT_DEFAULT_HELP_TEXTS["ris"],
+        **kwargs,
+    )
+
+
+def _build_bibtex_bib_format(format_key, format_config, kwargs, fields) -> BibFormatSpec:
+    return BibFormatSpec(
+        key=format_key,
+        field=fields["bibtex"],
+        label=format_config.get("label") or _BIB_FORMAT_DEFAULT_LABELS["bibtex"],
+        help_text=format_config.get("help_text") or _BIB_FORMAT_DEFAULT_HELP_TEXTS["bibtex"],
+        **kwargs,
+    )
+
+
+# Bib format builders, keyed by format key.
+_BIB_FORMAT_BUILDERS = {
+    "ris": _build_ris_bib_format,
+    "bibtex": _build_bibtex_bib_format,
+}
+
+
+def _build_cites_relation(rel_key, rel_config, fields) -> RelationSpec:
+    return RelationSpec(
+        key=rel_key,
+        field=fields["rel_cites"],
+        label=rel_config.get("label") or _RELATION_DEFAULT_LABELS["cites"],
+        weight=rel_config["weight"],
+        id_fields=[fields["id"], fields["alternate_id"]],
+        reverse=True,
+        reverse_key="isCitedBy",
+        reverse_field_key="rev_cites",
+        reverse_label=_RELATION_DEFAULT_LABELS["isCitedBy"],
+    )
+
+
+def _build_related_relation(rel_key, rel_config, fields) -> RelationSpec:
+    return RelationSpec(
+        key=rel_key,
+        field=fields["rel_related"],
+        label=rel_config.get("label") or _RELATION_DEFAULT_LABELS["related"],
+        weight=rel_config["weight"],
+        id_fields=[fields["id"]],
+        directed=False,
+    )
+
+
+# Relation builders, keyed by relation key.
+_RELATION_BUILDERS = {
+    "cites": _build_cites_relation,
+    "related": _build_related_relation,
+}
+
 
 class Composer:
     """
@@ -53,31 +376,11 @@ class Composer:
         methods.
         """
 
-        # When combining multiple strings into a single text field, the last
-        # token of each string becomes adjacent to the first token of the next
-        # string. This may cause phrase searches to match those tokens as if
-        # they were neighbors, even though they were not in the source data. To
-        # prevent this, we join the strings with the record separator character
-        # and treat that character as a token. This solution is imperfect,
-        # however, as the issue may still arise when a slop factor is applied to
-        # the phrase search.
-        token_pattern = rcompile(r"\w+(\.?\w+)*|" + re.escape(extractors.RECORD_SEPARATOR))
-
-        # Replace the standard analyzer with one that has no stop words (helping
-        # people who do phrase searches without specifying actual phrase queries).
-        self.text_chain = (
-            RegexTokenizer(expression=token_pattern)
-            | StemFilter(lang=config_get(config, "kerko.search.whoosh_language"))
-            | CharsetFilter(accent_map)
-            | LowercaseFilter()
+        self.text_chain, self.name_chain = _build_analyzers(
+            config_get(config, "kerko.search.whoosh_language")
         )
-
-        # Same for names, but without stemming.
-        self.name_chain = (
-            RegexTokenizer(expression=token_pattern) | CharsetFilter(accent_map) | LowercaseFilter()
-        )
-
         self.schema = Schema()
+        self._field_types: Dict[Tuple[Any, ...], FieldType] = {}
         self.scopes: Dict[str, ScopeSpec] = {}
         self.fields: Dict[str, FieldSpec] = {}
         self.facets: Dict[str, FacetSpec] = {}
@@ -87,6 +390,10 @@ class Composer:
         self.badges: Dict[str, BadgeSpec] = {}
         self.pages: Dict[str, PageSpec] = {}
         self.link_groups: Dict[str, LinkGroupSpec] = {}
+        self._ordered_specs: Dict[str, Tuple[Any, ...]] = {}  # Cache for get_ordered_specs().
+        self._scope_fields: Dict[str, Tuple[str, ...]] = {}  # Cache for get_scope_field_keys().
+        # Cache for get_facets_by_filter_key().
+        self._facets_by_filter_key: Optional[Dict[str, FacetSpec]] = None
         self.init_scopes(config)
         self.init_fields(config)
         self.init_facets(config)
@@ -100,65 +407,41 @@ class Composer:
         """
         Initialize a set of `ScopeSpec` instances using config settings.
         """
-        # Note: Default labels are defined here rather than in config so that they are translatable.
-        selector_label = {
-            "all": _("Everywhere"),
-            "creator": _("In authors or contributors"),
-            "title": _("In titles"),
-            "pubyear": _("In publication years"),
-            "metadata": _("In all fields"),
-            "fulltext": _("In documents"),
-        }
-        breadbox_label = {
-            "all": _("Everywhere"),
-            "creator": _("In authors or contributors"),
-            "title": _("In titles"),
-            "pubyear": _("In publication years"),
-            "metadata": _("In all fields"),
-            "fulltext": _("In documents"),
-        }
-        help_text = {
-            "all": _(
-                "Search your keywords in all bibliographic record fields "
-                "and in the text content of the available documents."
-            ),
-            "creator": _("Search your keywords in author or contributor names."),
-            "title": _("Search your keywords in titles."),
-            "pubyear": _(
-                "Search a specific publication year (you may use the <strong>%(or_op)s</strong> "
-                "operator with your keywords to find records having different publication years, "
-                "e.g., <code>2020 %(or_op)s 2021</code>).",
-                or_op=_("OR"),
-            ),
-            "metadata": _("Search your keywords in all bibliographic record fields."),
-            "fulltext": _("Search your keywords in the text content of the available documents."),
-        }
         scopes_dict = config_get(config, "kerko.scopes")
         for scope_key, scope_config in scopes_dict.items():
             if scope_config["enabled"]:
-                kwargs = {
-                    "weight": scope_config["weight"],
-                }
-                kwargs["selector_label"] = scope_config.get("selector_label") or selector_label.get(
-                    scope_key, scope_key
-                )
-                kwargs["breadbox_label"] = scope_config.get("breadbox_label") or breadbox_label.get(
-                    scope_key, scope_key
+                self.add_scope(
+                    ScopeSpec(
+                        key=scope_key,
+                        weight=scope_config["weight"],
+                        selector_label=scope_config.get("selector_label")
+                        or _SCOPE_LABELS.get(scope_key, scope_key),
+                        breadbox_label=scope_config.get("breadbox_label")
+                        or _SCOPE_LABELS.get(scope_key, scope_key),
+                        help_text=scope_config.get("help_text")
+                        or _SCOPE_HELP_TEXTS.get(scope_key, ""),
+                    )
                 )
-                kwargs["help_text"] = scope_config.get("help_text") or help_text.get(scope_key, "")
-                self.add_scope(ScopeSpec(key=scope_key, **kwargs))
 
     def init_fields(self, config: Config) -> None:
         """
         Initialize a set of `FieldSpec` instances using config settings.
         """
+        search_fields = config_get(config, "kerko.search_fields")
+        zotero_config = config_get(config, "kerko.zotero")
+
+        # Compile the tag patterns once, for all the extractors that use them.
+        tag_include_re = _compile_re(zotero_config["tag_include_re"])
+        tag_exclude_re = _compile_re(zotero_config["tag_exclude_re"])
+        child_include_re = _compile_re(zotero_config["child_include_re"])
+        child_exclude_re = _compile_re(zotero_config["child_exclude_re"])
 
         #
         # Required searchable fields (partially configurable).
         #
 
         # Primary ID used for resolving items. Same as the Zotero item key.
-        field_dict = config_get(config, "kerko.search_fields.core.required.id")
+        field_dict = search_fields["core"]["required"]["id"]
         self.add_field(
             FieldSpec(
                 key="id",
@@ -168,11 +451,11 @@ class Composer:
             )
         )
         # Alternate IDs used when the primary ID cannot be resolved.
-        field_dict = config_get(config, "kerko.search_fields.core.required.alternate_id")
+        field_dict = search_fields["core"]["required"]["alternate_id"]
         self.add_field(
             FieldSpec(
                 key="alternate_id",
-                field_type=ID(field_boost=field_dict["boost"]),
+                field_type=self._id_field_type(field_dict["boost"]),
                 scopes=field_dict["scopes"],
                 extractor=extractors.MultiExtractor(
                     extractors=[
@@ -184,8 +467,7 @@ class Composer:
                             extractor=extractors.ItemDataExtractor(key="extra"),
                             transformers=[
                                 transformers.find(
-                                    regex=r"^\s*(DOI|ISBN|ISSN):\s*(\S+)\s*$",
-                                    flags=re.IGNORECASE | re.MULTILINE,
+                                    regex=_ALTERNATE_ID_IN_EXTRA_RE,
                                     group=2,
                                     max_matches=0,
                                 ),
@@ -201,23 +483,21 @@ class Composer:
             )
         )
         # Item type label, searchable and stored.
-        field_dict = config_get(config, "kerko.search_fields.core.required.item_type_label")
+        field_dict = search_fields["core"]["required"]["item_type_label"]
         self.add_field(
             FieldSpec(
                 key="item_type_label",
-                field_type=TEXT(
-                    analyzer=self.text_chain, stored=True, field_boost=field_dict["boost"]
-                ),
+                field_type=self._text_field_type(self.text_chain, field_dict["boost"], stored=True),
                 scopes=field_dict["scopes"],
                 extractor=extractors.ItemTypeLabelExtractor(),
             )
         )
         # Publication year, based on a parsing of Zotero's Date field, searchable and stored.
-        field_dict = config_get(config, "kerko.search_fields.core.required.year")
+        field_dict = search_fields["core"]["required"]["year"]
         self.add_field(
             FieldSpec(
                 key="year",
-                field_type=ID(stored=True, field_boost=field_dict["boost"]),
+                field_type=self._id_field_type(field_dict["boost"], stored=True),
                 scopes=field_dict["scopes"],
                 extractor=extractors.YearExtractor(),
             )
@@ -227,66 +507,55 @@ class Composer:
         # Optional searchable fields (partially configurable).
         #
 
-        field_dict = config_get(config, "kerko.search_fields.core.optional.creator")
-        if field_dict["enabled"]:
-            self.add_field(
-                FieldSpec(
-                    key="text_creator",
-                    field_type=TEXT(analyzer=self.name_chain, field_boost=field_dict["boost"]),
-                    scopes=field_dict["scopes"],
-                    extractor=extractors.CreatorsExtractor(),
-                )
-            )
-        field_dict = config_get(config, "kerko.search_fields.core.optional.collections")
-        if field_dict["enabled"]:
-            self.add_field(
-                FieldSpec(
-                    key="text_collections",
-                    field_type=TEXT(analyzer=self.text_chain, field_boost=field_dict["boost"]),
-                    scopes=field_dict["scopes"],
-                    extractor=extractors.CollectionNamesExtractor(),
-                )
-            )
-        field_dict = config_get(config, "kerko.search_fields.core.optional.tags")
-        if field_dict["enabled"]:
-            self.add_field(
-                FieldSpec(
-                    key="text_tags",
-                    field_type=TEXT(analyzer=self.text_chain, field_boost=field_dict["boost"]),
-                    scopes=field_dict["scopes"],
-                    extractor=extractors.TagsTextExtractor(
-                        include_re=config_get(config, "kerko.zotero.tag_include_re"),
-                        exclude_re=config_get(config, "kerko.zotero.tag_exclude_re"),
-                    ),
-                )
-            )
-        field_dict = config_get(config, "kerko.search_fields.core.optional.notes")
-        if field_dict["enabled"]:
-            self.add_field(
-                FieldSpec(
-                    key="text_notes",
-                    field_type=TEXT(analyzer=self.text_chain, field_boost=field_dict["boost"]),
-                    scopes=field_dict["scopes"],
-                    extractor=extractors.ChildNotesTextExtractor(
-                        include_re=config_get(config, "kerko.zotero.child_include_re"),
-                        exclude_re=config_get(config, "kerko.zotero.child_exclude_re"),
-                    ),
-                )
-            )
-        field_dict = config_get(config, "kerko.search_fields.core.optional.documents")
-        if field_dict["enabled"]:
-            self.add_field(
-                FieldSpec(
-                    key="text_docs",
-                    field_type=TEXT(analyzer=self.text_chain, field_boost=field_dict["boost"]),
-                    scopes=field_dict["scopes"],
-                    extractor=extractors.ChildAttachmentsFulltextExtractor(
-                        mime_types=config_get(config, "kerko.zotero.attachment_mime_types"),
-                        include_re=config_get(config, "kerko.zotero.child_include_re"),
-                        exclude_re=config_get(config, "kerko.zotero.child_exclude_re"),
-                    ),
+        optional_fields = {
+            # Config key: (field key, analyzer, extractor factory). Extractors
+            # are only instantiated for the enabled fields.
+            "creator": ("text_creator", self.name_chain, extractors.CreatorsExtractor),
+            "collections": (
+                "text_collections",
+                self.text_chain,
+                extractors.CollectionNamesExtractor,
+            ),
+            "tags": (
+                "text_tags",
+                self.text_chain,
+                functools.partial(
+                    extractors.TagsTextExtractor,
+                    include_re=tag_include_re,
+                    exclude_re=tag_exclude_re,
+                ),
+            ),
+            "notes": (
+                "text_notes",
+                self.text_chain,
+                functools.partial(
+                    extractors.ChildNotesTextExtractor,
+                    include_re=child_include_re,
+                    exclude_re=child_exclude_re,
+                ),
+            ),
+            "documents": (
+                "text_docs",
+                self.text_chain,
+                functools.partial(
+                    extractors.ChildAttachmentsFulltextExtractor,
+                    mime_types=zotero_config["attachment_mime_types"],
+                    include_re=child_include_re,
+                    exclude_re=child_exclude_re,
+                ),
+            ),
+        }
+        for config_key, (field_key, analyzer, make_extractor) in optional_fields.items():
+            field_dict = search_fields["core"]["optional"][config_key]
+            if field_dict["enabled"]:
+                self.add_field(
+                    FieldSpec(
+                        key=field_key,
+                        field_type=self._text_field_type(analyzer, field_dict["boost"]),
+                        scopes=field_dict["scopes"],
+                        extractor=make_extractor(),
+                    )
                 )
-            )
 
         #
         # Required relation fields, searchable for internal purposes only (hence
@@ -297,7 +566,7 @@ class Composer:
         self.add_field(
             FieldSpec(
                 key="rel_cites",
-                field_type=ID(stored=True),
+                field_type=_ID_STORED,
                 extractor=extractors.RelationsInChildNotesExtractor(
                     include_re=r"_cites", exclude_re=""
                 ),
@@ -307,7 +576,7 @@ class Composer:
         self.add_field(
             FieldSpec(
                 key="rel_related",
-                field_type=ID(stored=True),
+                field_type=_ID_STORED,
                 extractor=extractors.TransformerExtractor(
                     extractor=extractors.ItemRelationsExtractor(
                         predicate="dc:relation",
@@ -324,138 +593,52 @@ class Composer:
         self.add_field(
             FieldSpec(
                 key="item_type",
-                field_type=ID(stored=True),
+                field_type=_ID_STORED,
                 extractor=extractors.ItemDataExtractor(key="itemType"),
             )
         )
-        self.add_field(
-            FieldSpec(
-                key="date_added",
-                field_type=STORED,
-                extractor=extractors.ItemDataExtractor(key="dateAdded"),
-            )
-        )
-        self.add_field(
-            FieldSpec(
-                key="date_modified",
-                field_type=STORED,
-                extractor=extractors.ItemDataExtractor(key="dateModified"),
-            )
-        )
-        # URL from Zotero's URL field.
-        self.add_field(
-            FieldSpec(
-                key="url",
-                field_type=STORED,
-                extractor=extractors.ItemDataExtractor(key="url"),
-            )
-        )
-        # Formatted citation.
-        self.add_field(
-            FieldSpec(
-                key="bib",
-                field_type=STORED,
-                extractor=extractors.ItemExtractor(key="bib", format_="bib"),
-            )
-        )
-        # OpenURL Coins.
-        self.add_field(
-            FieldSpec(
-                key="coins",
-                field_type=STORED,
-                extractor=extractors.ItemExtractor(key="coins", format_="coins"),
-            )
-        )
-        # RIS.
-        self.add_field(
-            FieldSpec(
-                key="ris",
-                field_type=STORED,
-                extractor=extractors.ItemExtractor(key="ris", format_="ris"),
-            )
-        )
-        # BibTeX.
-        self.add_field(
-            FieldSpec(
-                key="bibtex",
-                field_type=STORED,
-                extractor=extractors.ItemExtractor(key="bibtex", format_="bibtex"),
-            )
-        )
-        # Raw item data.
-        self.add_field(
-            FieldSpec(
-                key="data",
-                field_type=STORED,
-                extractor=extractors.RawDataExtractor(),
-            )
-        )
-        # Child notes of the item.
-        self.add_field(
-            FieldSpec(
-                key="notes",
-                field_type=STORED,
-                extractor=extractors.RawChildNotesExtractor(
-                    include_re=config_get(config, "kerko.zotero.child_include_re"),
-                    exclude_re=config_get(config, "kerko.zotero.child_exclude_re"),
-                ),
-            )
-        )
-        # URL attachments of the item.
-        self.add_field(
-            FieldSpec(
-                key="links",
-                field_type=STORED,
-                extractor=extractors.ChildLinkedURIAttachmentsExtractor(
-                    include_re=config_get(config, "kerko.zotero.child_include_re"),
-                    exclude_re=config_get(config, "kerko.zotero.child_exclude_re"),
-                ),
-            )
-        )
-        # File attachments of the item.
-        self.add_field(
-            FieldSpec(
-                key="attachments",
-                field_type=STORED,
-                extractor=extractors.ChildFileAttachmentsExtractor(
-                    mime_types=config_get(config, "kerko.zotero.attachment_mime_types"),
-                    include_re=config_get(config, "kerko.zotero.child_include_re"),
-                    exclude_re=config_get(config, "kerko.zotero.child_exclude_re"),
-                ),
-            )
-        )
-        # Fields and labels for this item type, for convenient access.
-        self.add_field(
-            FieldSpec(
-                key="item_fields",
-                field_type=STORED,
-                extractor=extractors.ItemFieldsExtractor(),
-            )
-        )
-        # Creator types for this item type, for convenient access.
-        self.add_field(
-            FieldSpec(
-                key="creator_types",
-                field_type=STORED,
-                extractor=extractors.CreatorTypesExtractor(),
-            )
-        )
-        # URL for opening item in Zotero app.
-        self.add_field(
-            FieldSpec(
-                key="zotero_app_url",
-                field_type=STORED,
-                extractor=extractors.ZoteroAppItemURLExtractor(),
-            )
-        )
-        # URL of the item on zotero.org.
-        self.add_field(
-            FieldSpec(
-                key="zotero_web_url",
-                field_type=STORED,
-                extractor=extractors.ZoteroWebItemURLExtractor(),
-            )
-        )
+        stored_fields = {
+            "date_added": extractors.ItemDataExtractor(key="dateAdded"),
+            "date_modified": extractors.ItemDataExtractor(key="dateModified"),
+            # URL from Zotero's URL field.
+            "url": extractors.ItemDataExtractor(key="url"),
+            # Formatted citation.
+            "bib": extractors.ItemExtractor(key="bib", format_="bib"),
+            # OpenURL Coins.
+            "coins": extractors.ItemExtractor(key="coins", format_="coins"),
+            # RIS.
+            "ris": extractors.ItemExtractor(key="ris", format_="ris"),
+            # BibTeX.
+            "bibtex": extractors.ItemExtractor(key="bibtex", format_="bibtex"),
+            # Raw item data.
+            "data": extractors.RawDataExtractor(),
+            # Child notes of the item.
+            "notes": extractors.RawChildNotesExtractor(
+                include_re=child_include_re,
+                exclude_re=child_exclude_re,
+            ),
+            # URL attachments of the item.
+            "links": extractors.ChildLinkedURIAttachmentsExtractor(
+                include_re=child_include_re,
+                exclude_re=child_exclude_re,
+            ),
+            # File attachments of the item.
+            "attachments": extractors.ChildFileAttachmentsExtractor(
+                mime_types=zotero_config["attachment_mime_types"],
+                include_re=child_include_re,
+                exclude_re=child_exclude_re,
+            ),
+            # Fields and labels for this item type, for convenient access.
+            "item_fields": extractors.ItemFieldsExtractor(),
+            # Creator types for this item type, for convenient access.
+            "creator_types": extractors.CreatorTypesExtractor(),
+            # URL for opening item in Zotero app.
+            "zotero_app_url": extractors.ZoteroAppItemURLExtractor(),
+            # URL of the item on zotero.org.
+            "zotero_web_url": extractors.ZoteroWebItemURLExtractor(),
+        }
+        for field_key, extractor in stored_fields.items():
+            self.add_field(FieldSpec(key=field_key, field_type=STORED, extractor=extractor))
 
         #
         # Optional searchable fields from Zotero items (configurable).
@@ -463,52 +646,36 @@ class Composer:
 
         # Those field names are prefixed with 'z_' in the search schema to
         # prevent clashes with other fields should Zotero's schema change.
-        zotero_fields_dict = config_get(config, "kerko.search_fields.zotero")
+        text_analyzers = {
+            # Text fields go through the text tokenization, stemming, etc.
+            "text": self.text_chain,
+            # Name fields are handled like text, but without stemming.
+            "name": self.name_chain,
+        }
+        zotero_fields_dict = search_fields["zotero"]
         for field_key, field_config in zotero_fields_dict.items():
             if field_config["enabled"]:
                 analyzer = field_config["analyzer"]
                 if analyzer == "id":
                     # Identifier fields are indexed as-is.
-                    self.add_field(
-                        FieldSpec(
-                            key=f"z_{field_key}",
-                            field_type=ID(field_boost=field_config["boost"]),
-                            scopes=field_config["scopes"],
-                            extractor=extractors.ItemDataExtractor(key=field_key),
-                        )
+                    field_type = self._id_field_type(field_config["boost"])
+                    extractor = extractors.ItemDataExtractor(key=field_key)
+                else:
+                    field_type = self._text_field_type(
+                        text_analyzers[analyzer], field_config["boost"]
                     )
-                elif analyzer == "text":
-                    # Text fields go through the text tokenization, stemming, etc.
-                    self.add_field(
-                        FieldSpec(
-                            key=f"z_{field_key}",
-                            field_type=TEXT(
-                                analyzer=self.text_chain,
-                                field_boost=field_config["boost"],
-                            ),
-                            scopes=field_config["scopes"],
-                            extractor=extractors.TransformerExtractor(
-                                extractor=extractors.ItemDataExtractor(key=field_key),
-                                transformers=[richtext_striptags],
-                            ),
-                        )
+                    extractor = extractors.TransformerExtractor(
+                        extractor=extractors.ItemDataExtractor(key=field_key),
+                        transformers=[richtext_striptags],
                     )
-                elif analyzer == "name":
-                    # Name fields are handled like text, but without stemming.
-                    self.add_field(
-                        FieldSpec(
-                            key=f"z_{field_key}",
-                            field_type=TEXT(
-                                analyzer=self.name_chain,
-                                field_boost=field_config["boost"],
-                            ),
-                            scopes=field_config["scopes"],
-                            extractor=extractors.TransformerExtractor(
-                                extractor=extractors.ItemDataExtractor(key=field_key),
-                                transformers=[richtext_striptags],
-                            ),
-                        )
+                self.add_field(
+                    FieldSpec(
+                        key=f"z_{field_key}",
+                        field_type=field_type,
+                        scopes=field_config["scopes"],
+                        extractor=extractor,
                     )
+                )
 
         #
         # Required fields for sorting (non-configurable).
@@ -517,28 +684,28 @@ class Composer:
         self.add_field(
             FieldSpec(
                 key="sort_title",
-                field_type=TEXT(phrase=False, sortable=True),
+                field_type=_SORTABLE_TEXT,
                 extractor=extractors.SortTitleExtractor(),
             )
         )
         self.add_field(
             FieldSpec(
                 key="sort_creator",
-                field_type=TEXT(phrase=False, sortable=True),
+                field_type=_SORTABLE_TEXT,
                 extractor=extractors.SortCreatorExtractor(),
             )
         )
         self.add_field(
             FieldSpec(
                 key="sort_date",
-                field_type=NUMERIC(sortable=True),
+                field_type=_SORTABLE_NUMERIC,
                 extractor=extractors.SortDateExtractor(),
             )
         )
         self.add_field(
             FieldSpec(
                 key="sort_date_added",
-                field_type=NUMERIC(sortable=True),
+                field_type=_SORTABLE_NUMERIC,
                 extractor=extractors.TransformerExtractor(
                     extractor=extractors.ItemDataExtractor(key="dateAdded"),
                     transformers=[iso_to_timestamp],
@@ -548,7 +715,7 @@ class Composer:
         self.add_field(
             FieldSpec(
                 key="sort_date_modified",
-                field_type=NUMERIC(sortable=True),
+                field_type=_SORTABLE_NUMERIC,
                 extractor=extractors.TransformerExtractor(
                     extractor=extractors.ItemDataExtractor(key="dateModified"),
                     transformers=[iso_to_timestamp],
@@ -576,96 +743,52 @@ class Composer:
             )
         )
 
+    def _id_field_type(self, boost: float, stored: bool = False) -> FieldType:
+        """
+        Return an `ID` field type, shared with other fields having the same settings.
+
+        Whoosh field types hold no per-field state, hence fields with identical
+        settings may safely share the same instance.
+        """
+        key = ("id", boost, stored)
+        if key not in self._field_types:
+            self._field_types[key] = ID(stored=stored, field_boost=boost)
+        return self._field_types[key]
+
+    def _text_field_type(self, analyzer: Analyzer, boost: float, stored: bool = False) -> FieldType:
+        """
+        Return a `TEXT` field type, shared with other fields having the same settings.
+
+        .. seealso: :meth:`_id_field_type`.
+        """
+        # Analyzers are unhashable, but each one lives as long as the composer.
+        key = ("text", id(analyzer), boost, stored)
+        if key not in self._field_types:
+            self._field_types[key] = TEXT(analyzer=analyzer, stored=stored, field_boost=boost)
+        return self._field_types[key]
+
     def init_facets(self, config: Config) -> None:
         """
         Initialize a set of `FacetSpec` instances using config settings.
         """
-        # Note: Default titles are defined here rather than in config so that they are translatable.
-        # TODO: Refactor facet using factory methods in the models, as in init_link_groups().
         facets_dict = config_get(config, "kerko.facets")
+        zotero_config = config_get(config, "kerko.zotero")
+        facet_builders = {
+            **_FACET_BUILDERS,
+            "tag": functools.partial(
+                _build_tag_facet,
+                include_re=_compile_re(zotero_config["tag_include_re"]),
+                exclude_re=_compile_re(zotero_config["tag_exclude_re"]),
+            ),
+        }
         for facet_key, facet_config in facets_dict.items():
             if facet_config["enabled"]:
-                facet_type = facet_config["type"]
-                kwargs = {
-                    k: v for k, v in facet_config.items() if k not in ["enabled", "title", "type"]
-                }
-                if facet_type == "tag":
-                    self.add_facet(
-                        FlatFacetSpec(
-                            key=f"facet_{facet_key}",
-                            field_type=ID(stored=True),
-                            extractor=extractors.TagsFacetExtractor(
-                                include_re=config_get(config, "kerko.zotero.tag_include_re"),
-                                exclude_re=config_get(config, "kerko.zotero.tag_exclude_re"),
-                            ),
-                            codec=codecs.BaseFacetCodec(),
-                            title=facet_config.get("title") or _("Topic"),
-                            missing_label=None,  # TODO:config: Allow in config.
-                            allow_overlap=True,
-                            query_class=Term,
-                            **kwargs,
-                        )
-                    )
-                elif facet_type == "item_type":
-                    self.add_facet(
-                        FlatFacetSpec(
-                            key=f"facet_{facet_key}",
-                            field_type=ID(stored=True),
-                            extractor=extractors.ItemTypeFacetExtractor(),
-                            codec=codecs.ItemTypeFacetCodec(),
-                            title=facet_config.get("title") or _("Resource type"),
-                            missing_label=None,  # TODO:config: Allow in config.
-                            allow_overlap=False,
-                            query_class=Prefix,
-                            **kwargs,
-                        )
-                    )
-                elif facet_type == "year":
-                    self.add_facet(
-                        TreeFacetSpec(
-                            key=f"facet_{facet_key}",
-                            field_type=ID(stored=True),
-                            extractor=extractors.YearFacetExtractor(),
-                            codec=codecs.YearTreeFacetCodec(),
-                            title=facet_config.get("title") or _("Publication year"),
-                            missing_label=_("Unknown"),  # TODO:config: Allow in config.
-                            allow_overlap=True,
-                            query_class=Prefix,
-                            **kwargs,
-                        )
-                    )
-                elif facet_type == "language":
-                    self.add_facet(
-                        LanguageFacetSpec(
-                            key=f"facet_{facet_key}",
-                            title=facet_config.get("title") or _("Resource language"),
-                            missing_label=None,  # TODO:config: Allow in config.
-                            **kwargs,
-                        )
-                    )
-                elif facet_type == "link":
-                    self.add_facet(
-                        FlatFacetSpec(
-                            key=f"facet_{facet_key}",
-                            field_type=BOOLEAN(stored=True),
-                            extractor=extractors.ItemDataLinkFacetExtractor(key="url"),
-                            codec=codecs.BooleanFacetCodec(),
-                            title=facet_config.get("title") or _("Online resource"),
-                            missing_label=None,
-                            allow_overlap=False,
-                            query_class=Term,
-                            **kwargs,
-                        )
-                    )
-                elif facet_type == "collection":
-                    self.add_facet(
-                        CollectionFacetSpec(
-                            key=f"facet_{facet_key}",
-                            title=facet_config["title"],
-                            missing_label=None,  # TODO:config: Allow in config.
-                            **kwargs,
-                        )
-                    )
+                builder = facet_builders.get(facet_config["type"])
+                if builder:
+                    kwargs = {
+                        k: v for k, v in facet_config.items() if k not in _FACET_CONFIG_NON_KWARGS
+                    }
+                    self.add_facet(builder(facet_key, facet_config, kwargs))
 
     def init_sorts(self, config: Config) -> None:
         """
@@ -673,114 +796,12 @@ class Composer:
 
         These rely on `FieldSpec` instances, which must have been added beforehand.
         """
-        # Note: Default labels are defined here rather than in config so that they are translatable.
         sorts_dict = config_get(config, "kerko.sorts")
         for sort_key, sort_config in sorts_dict.items():
             if sort_config["enabled"]:
-                if sort_key == "score":
-                    self.add_sort(
-                        SortSpec(
-                            key=sort_key,
-                            label=sort_config.get("label") or _("Relevance"),
-                            weight=sort_config["weight"],
-                            fields=None,
-                            # Sort by score is only possible on keyword search.
-                            is_allowed=lambda criteria: criteria.has_keywords(),
-                        )
-                    )
-                elif sort_key == "date_desc":
-                    self.add_sort(
-                        SortSpec(
-                            key=sort_key,
-                            label=sort_config.get("label") or _("Newest first"),
-                            weight=sort_config["weight"],
-                            fields=[
-                                self.fields["sort_date"],
-                                self.fields["sort_creator"],
-                                self.fields["sort_title"],
-                            ],
-                            reverse=[
-                                True,
-                                False,
-                                False,
-                            ],
-                        )
-                    )
-                elif sort_key == "date_asc":
-                    self.add_sort(
-                        SortSpec(
-                            key=sort_key,
-                            label=sort_config.get("label") or _("Oldest first"),
-                            weight=sort_config["weight"],
-                            fields=[
-                                self.fields["sort_date"],
-                                self.fields["sort_creator"],
-                                self.fields["sort_title"],
-                            ],
-                        )
-                    )
-                elif sort_key == "author_asc":
-                    self.add_sort(
-                        SortSpec(
-                            key=sort_key,
-                            label=sort_config.get("label") or _("Author A-Z"),
-                            weight=sort_config["weight"],
-                            fields=[
-                                self.fields["sort_creator"],
-                                self.fields["sort_title"],
-                                self.fields["sort_date"],
-                            ],
-                        )
-                    )
-                elif sort_key == "author_desc":
-                    self.add_sort(
-                        SortSpec(
-                            key=sort_key,
-                            label=sort_config.get("label") or _("Author Z-A"),
-                            weight=sort_config["weight"],
-                            fields=[
-                                self.fields["sort_creator"],
-                                self.fields["sort_title"],
-                                self.fields["sort_date"],
-                            ],
-                            reverse=[
-                                True,
-                                False,
-                                False,
-                            ],
-                        )
-                    )
-                elif sort_key == "title_asc":
-                    self.add_sort(
-                        SortSpec(
-                            key=sort_key,
-                            label=sort_config.get("label") or _("Title A-Z"),
-                            weight=sort_config["weight"],
-                            fields=[
-                                self.fields["sort_title"],
-                                self.fields["sort_creator"],
-                                self.fields["sort_date"],
-                            ],
-                        )
-                    )
-                elif sort_key == "title_desc":
-                    self.add_sort(
-                        SortSpec(
-                            key=sort_key,
-                            label=sort_config.get("label") or _("Title Z-A"),
-                            weight=sort_config["weight"],
-                            fields=[
-                                self.fields["sort_title"],
-                                self.fields["sort_creator"],
-                                self.fields["sort_date"],
-                            ],
-                            reverse=[
-                                True,
-                                False,
-                                False,
-                            ],
-                        )
-                    )
+                builder = _SORT_BUILDERS.get(sort_key)
+                if builder:
+                    self.add_sort(builder(sort_key, sort_config, self.fields))
 
     def init_bib_formats(self, config: Config) -> None:
         """
@@ -791,33 +812,10 @@ class Composer:
         formats_dict = config_get(config, "kerko.bib_formats")
         for format_key, format_config in formats_dict.items():
             if format_config["enabled"]:
-                kwargs = {
-                    k: v
-                    for k, v in format_config.items()
-                    if k in ["weight", "extension", "mime_type"]
-                }
-                if format_key == "ris":
-                    self.add_bib_format(
-                        BibFormatSpec(
-                            key=format_key,
-                            field=self.fields["ris"],
-                            label=format_config.get("label") or _("RIS"),
-                            help_text=format_config.get("help_text")
-                            or _("Recommended format for most reference management software"),
-                            **kwargs,
-                        )
-                    )
-                elif format_key == "bibtex":
-                    self.add_bib_format(
-                        BibFormatSpec(
-                            key=format_key,
-                            field=self.fields["bibtex"],
-                            label=format_config.get("label") or _("BibTeX"),
-                            help_text=format_config.get("help_text")
-                            or _("Recommended format for BibTeX-specific software"),
-                            **kwargs,
-                        )
-                    )
+                kwargs = {k: v for k, v in format_config.items() if k in _BIB_FORMAT_CONFIG_KWARGS}
+                builder = _BIB_FORMAT_BUILDERS.get(format_key)
+                if builder:
+                    self.add_bib_format(builder(format_key, format_config, kwargs, self.fields))
 
     def init_relations(self, config: Config) -> None:
         """
@@ -828,53 +826,39 @@ class Composer:
         relations_dict = config_get(config, "kerko.relations")
         for rel_key, rel_config in relations_dict.items():
             if rel_config["enabled"]:
-                if rel_key == "cites":
-                    self.add_relation(
-                        RelationSpec(
-                            key=rel_key,
-                            field=self.fields["rel_cites"],
-                            label=rel_config.get("label") or _("Cites"),
-                            weight=rel_config["weight"],
-                            id_fields=[self.fields["id"], self.fields["alternate_id"]],
-                            reverse=True,
-                            reverse_key="isCitedBy",
-                            reverse_field_key="rev_cites",
-                            reverse_label=_("Cited by"),
-                        )
-                    )
-                elif rel_key == "related":
-                    self.add_relation(
-                        RelationSpec(
-                            key=rel_key,
-                            field=self.fields["rel_related"],
-                            label=rel_config.get("label") or _("Related"),
-                            weight=rel_config["weight"],
-                            id_fields=[self.fields["id"]],
-                            directed=False,
-                        )
-                    )
+                builder = _RELATION_BUILDERS.get(rel_key)
+                if builder:
+                    self.add_relation(builder(rel_key, rel_config, self.fields))
 
     def init_pages(self, config: Config) -> None:
         pages = config["kerko_config"].kerko.pages
         self.pages = pages.to_spec() if pages else {}
+        self._ordered_specs.pop("pages", None)
 
     def init_link_groups(self, config: Config) -> None:
         self.link_groups = config["kerko_config"].kerko.link_groups.to_spec()
+        self._ordered_specs.pop("link_groups", None)
 
     def add_scope(self, scope):
         self.scopes[scope.key] = scope
+        self._ordered_specs.pop("scopes", None)
 
     def remove_scope(self, key):
         del self.scopes[key]
+        self._ordered_specs.pop("scopes", None)
 
     def add_field(self, field):
         self.fields[field.key] = field
         if field.field_type:
             self.schema.add(field.key, field.field_type)
+        self._ordered_specs.pop("fields", None)
+        self._scope_fields.clear()
 
     def remove_field(self, key):
         self.schema.remove(key)
         del self.fields[key]
+        self._ordered_specs.pop("fields", None)
+        self._scope_fields.clear()
 
     def select_fields(self, keys):
         """
@@ -883,59 +867,124 @@ class Composer:
         :param list keys: Keys of the desired specs. Key that don't exist in the
             specifications dict are silently ignored.
 
-        :return dict: The desired specs.
+        :return dict: The desired specs, in the order of `keys`.
+        """
+        fields = self.fields
+        return {key: fields[key] for key in keys if key in fields}
+
+    def get_scope_field_keys(self, scope_key):
+        """
+        Return the keys of the fields that are searched by a given scope.
+
+        The tuple is cached until fields are added or removed through the
+        composer's methods.
+
+        :param str scope_key: Key of the scope.
         """
-        return {key: self.fields[key] for key in self.fields.keys() & keys}
+        field_keys = self._scope_fields.get(scope_key)
+        if field_keys is None:
+            field_keys = tuple(
+                field.key for field in self.fields.values() if scope_key in field.scopes
+            )
+            self._scope_fields[scope_key] = field_keys
+        return field_keys
 
     def add_facet(self, facet):
         self.facets[facet.key] = facet
         self.schema.add(facet.key, facet.field_type)
+        self._ordered_specs.pop("facets", None)
+        self._facets_by_filter_key = None
 
     def remove_facet(self, key):
         self.schema.remove(key)
         del self.facets[key]
+        self._ordered_specs.pop("facets", None)
+        self._facets_by_filter_key = None
+
+    def get_facets_by_filter_key(self):
+        """
+        Return the facet specifications, keyed by filter key instead of spec key.
+
+        The dict is cached until facets are added or removed through the
+        composer's methods, hence it must not be modified.
+        """
+        if self._facets_by_filter_key is None:
+            self._facets_by_filter_key = {f.filter_key: f for f in self.facets.values()}
+        return self._facets_by_filter_key
 
     def add_sort(self, sort):
         self.sorts[sort.key] = sort
+        self._ordered_specs.pop("sorts", None)
 
     def remove_sort(self, key):
         del self.sorts[key]
+        self._ordered_specs.pop("sorts", None)
 
     def add_bib_format(self, bib_format):
         self.bib_formats[bib_format.key] = bib_format
+        self._ordered_specs.pop("bib_formats", None)
 
     def remove_bib_format(self, key):
         del self.bib_formats[key]
+        self._ordered_specs.pop("bib_formats", None)
 
     def add_badge(self, badge):
         self.badges[badge.key] = badge
+        self._ordered_specs.pop("badges", None)
 
     def remove_badge(self, key):
         del self.badges[key]
+        self._ordered_specs.pop("badges", None)
 
     def add_relation(self, relation):
         self.relations[relation.key] = relation
+        self._ordered_specs.pop("relations", None)
 
     def remove_relation(self, key):
         del self.relations[key]
+        self._ordered_specs.pop("relations", None)
 
     def add_page(self, key: str, page: PageSpec):
         self.pages[key] = page
+        self._ordered_specs.pop("pages", None)
 
     def remove_page(self, key: str):
         del self.pages[key]
+        self._ordered_specs.pop("pages", None)
 
     def add_link_group(self, key: str, link_group: LinkGroupSpec):
         self.link_groups[key] = link_group
+        self._ordered_specs.pop("link_groups", None)
 
     def remove_link_group(self, key: str):
         del self.link_groups[key]
+        self._ordered_specs.pop("link_groups", None)
 
     def get_ordered_specs(self, attr):
         """
-        Return a list of specifications, sorted by weight.
+        Return a tuple of specifications, sorted by weight.
+
+        The tuple is cached until specifications are added to or removed from
+        the dict through the composer's methods. Changing the weight of a
+        specification after the tuple has been requested requires the cache to
+        be invalidated by removing and re-adding that specification.
 
         :param str attr: Attribute name of the specifications dict. The
             specifications must themselves have a `weight` attribute.
         """
-        return sorted(getattr(self, attr).values(), key=lambda spec: spec.weight)
+        ordered_specs = self._ordered_specs.get(attr)
+        if ordered_specs is None:
+            ordered_specs = tuple(sorted(getattr(self, attr).values(), key=attrgetter("weight")))
+            self._ordered_specs[attr] = ordered_specs
+        return ordered_specs
+
+    def warmup(self):
+        """
+        Populate the cache of ordered specifications.
+
+        This may be called once the composer is set up, typically when the
+        blueprint gets registered on the app, to spare that work to the first
+        requests.
+        """
+        for attr in ["scopes", "facets", "sorts", "bib_formats", "badges", "relations"]:
+            self.get_ordered_specs(attr)
@@ -379,13 +379,13 @@ class BaseTagsExtractor(Extractor):
         """
         Initialize the extractor.
 
-        :param str include_re: Any tag that does not matches this regular
-            expression will be ignored by the extractor. If empty, all tags will
-            be accepted unless `exclude_re` is set and they match it.
+        :param [str,Pattern] include_re: Any tag that does not matches this
+            regular expression will be ignored by the extractor. If empty, all
+            tags will be accepted unless `exclude_re` is set and they match it.
 
-        :param str exclude_re: Any tag that matches this regular expression
-            will be ignored by the extractor. If empty, all tags will be
-            accepted unless `include_re` is set and they do not match it.
+        :param [str,Pattern] exclude_re: Any tag that matches this regular
+            expression will be ignored by the extractor. If empty, all tags will
+            be accepted unless `include_re` is set and they do not match it.
         """
         super().__init__(**kwargs)
         self.include = re.compile(include_re) if include_re else None
@@ -533,17 +533,18 @@ class BaseChildrenExtractor(Extractor):
         :param str item_type: The type of child items to extract, either 'note'
             or 'attachment'.
 
-        :param [str,list] include_re: Any child which does not have a tag that
+        :param [str,Pattern,list] include_re: Any child which does not have a
+            tag that matches this regular expression will be ignored by the
+            extractor. If empty, all children will be accepted unless
+            `exclude_re` is set and causes some to be rejected. When passing a
+            list, every pattern of the list must match at least a tag for the
+            child to be included.
+
+        :param [str,Pattern,list] exclude_re: Any child that have a tag that
             matches this regular expression will be ignored by the extractor. If
-            empty, all children will be accepted unless `exclude_re` is set and
+            empty, all children will be accepted unless `include_re` is set and
             causes some to be rejected. When passing a list, every pattern of
-            the list must match at least a tag for the child to be included.
-
-        :param [str,list] exclude_re: Any child that have a tag that matches
-            this regular expression will be ignored by the extractor. If empty,
-            all children will be accepted unless `include_re` is set and causes
-            some to be rejected. When passing a list, every pattern of the list
-            must match at least a tag for the child to be excluded.
+            the list must match at least a tag for the child to be excluded.
         """
         super().__init__(**kwargs)
         self.item_type = item_type
@@ -31,11 +31,22 @@ class Searcher:
     ):
         self.searcher = index.searcher()
         self.schema = schema or composer().schema
-        self.field_specs = field_specs or composer().fields
-        self.facet_specs = {  # Reorganize by filter key instead of spec key.
-            f.filter_key: f
-            for f in (facet_specs.values() if facet_specs else composer().facets.values())
-        }
+        if field_specs:
+            self.field_specs = field_specs
+            # Map each scope key to the keys of the fields it searches.
+            scope_field_keys = {}
+            for field_spec in field_specs.values():
+                for scope_key in field_spec.scopes:
+                    scope_field_keys.setdefault(scope_key, []).append(field_spec.key)
+            self._get_scope_field_keys = scope_field_keys.get
+        else:
+            self.field_specs = composer().fields
+            self._get_scope_field_keys = composer().get_scope_field_keys
+        if facet_specs:
+            # Reorganize by filter key instead of spec key.
+            self.facet_specs = {f.filter_key: f for f in facet_specs.values()}
+        else:
+            self.facet_specs = composer().get_facets_by_filter_key()
         self.search_args = {}  # Arguments to pass to Whoosh's searcher.
 
     def close(self):
@@ -116,11 +127,7 @@ class Searcher:
                 plugins.BoostPlugin(),
             ]
             for key, value in keywords.items(multi=True):
-                fields = [
-                    field_spec.key
-                    for field_spec in self.field_specs.values()
-                    if key in field_spec.scopes
-                ]
+                fields = self._get_scope_field_keys(key)
                 if not fields:
                     raise KeyError  # No known field for that scope key.
                 parser = MultifieldParser(fields, schema=self.schema, plugins=text_plugins)
@@ -290,7 +297,22 @@ class Results(ABC):
             each item. Any requested facet that is not present in a result is
             silently ignored for that result.
         """
-        return [self._item(hit, field_specs, facet_specs) for hit in self._results]
+        return list(self.iter_items(field_specs, facet_specs))
+
+    def iter_items(self, field_specs, facet_specs=None):
+        """
+        Iterate over search result items, with just the specified fields.
+
+        Unlike `items()`, this loads the stored fields of each result only as
+        the iteration reaches it, rather than loading all results in memory at
+        once.
+
+        This may be called only while the searcher object is still alive.
+
+        .. seealso: :meth:`items` arguments.
+        """
+        for hit in self._results:
+            yield self._item(hit, field_specs, facet_specs)
 
     def facets(self, facet_specs, criteria, active_only=False):
         """
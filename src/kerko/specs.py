@@ -22,6 +22,8 @@ class ScopeSpec:
     This is a configuration element, with no effect on the search index schema.
     """
 
+    __slots__ = ("key", "selector_label", "breadbox_label", "weight", "help_text")
+
     def __init__(self, key, selector_label, breadbox_label, weight=0, help_text=""):
         self.key = key
         self.selector_label = selector_label
@@ -62,6 +64,8 @@ class ScopeSpec:
 
 
 class BaseFieldSpec(ABC):
+    __slots__ = ("key", "field_type", "extractor")
+
     def __init__(
         self,
         key,
@@ -94,6 +98,8 @@ class BaseFieldSpec(ABC):
 class FieldSpec(BaseFieldSpec):
     """Specifies a schema field."""
 
+    __slots__ = ("scopes", "codec")
+
     def __init__(self, codec=None, scopes=None, **kwargs):
         """
         Initialize this field specification.
@@ -118,6 +124,22 @@ class FieldSpec(BaseFieldSpec):
 class FacetSpec(BaseFieldSpec):
     """Specifies a facet for search grouping and filtering."""
 
+    __slots__ = (
+        "title",
+        "filter_key",
+        "weight",
+        "initial_limit",
+        "initial_limit_leeway",
+        "codec",
+        "missing_label",
+        "sort_by",
+        "sort_reverse",
+        "item_view",
+        "allow_overlap",
+        "query_class",
+        "renderer",
+    )
+
     def __init__(
         self,
         *,
@@ -271,6 +293,8 @@ class FacetSpec(BaseFieldSpec):
 
 
 class FlatFacetSpec(FacetSpec):
+    __slots__ = ()
+
     def add_filter(self, value, active_filters):
         if value is None:  # Special case for missing value (None is returned by Whoosh).
             value = ""
@@ -344,6 +368,8 @@ class FlatFacetSpec(FacetSpec):
 
 
 class TreeFacetSpec(FacetSpec):
+    __slots__ = ("path_separator",)
+
     def __init__(self, path_separator=".", **kwargs):
         super().__init__(**kwargs)
         self.path_separator = path_separator
@@ -489,6 +515,8 @@ class LanguageFacetSpec(FlatFacetSpec):
     Specifies a facet based on the Zotero language field.
     """
 
+    __slots__ = ()
+
     def __init__(
         self, *, values_separator_re=";", normalize=True, locale="en", allow_invalid=True, **kwargs
     ):
@@ -518,6 +546,8 @@ class CollectionFacetSpec(TreeFacetSpec):
     given `collection_key`. Subcollections become values within the facet.
     """
 
+    __slots__ = ("collection_key",)
+
     def __init__(self, *, collection_key, **kwargs):
         # Provide some convenient defaults for this type of facet.
         kwargs.setdefault("key", f"facet_collection_{collection_key}")
@@ -537,6 +567,8 @@ class SortSpec:
     This is a configuration element, with no effect on the search index schema.
     """
 
+    __slots__ = ("key", "label", "fields", "weight", "reverse", "_is_allowed")
+
     def __init__(
         self,
         key,
@@ -553,8 +585,9 @@ class SortSpec:
 
         :param str label: Label of this sort option.
 
-        :param list fields: List of `FieldSpec` instances to use when doing
-            search queries with this sort option, in order of precedence.
+        :param [list,tuple] fields: Sequence of `FieldSpec` instances to use
+            when doing search queries with this sort option, in order of
+            precedence.
 
         :param int weight: Determine the position of this option relative to the
             other options.
@@ -600,6 +633,18 @@ class BibFormatSpec:
     This is a configuration element, with no effect on the search index schema.
     """
 
+    __slots__ = (
+        "key",
+        "field",
+        "label",
+        "help_text",
+        "weight",
+        "extension",
+        "mime_type",
+        "group_format",
+        "group_item_delimiter",
+    )
+
     def __init__(
         self,
         key,
@@ -651,6 +696,19 @@ class RelationSpec:
     This is a configuration element, with no effect on the search index schema.
     """
 
+    __slots__ = (
+        "key",
+        "field",
+        "label",
+        "weight",
+        "id_fields",
+        "directed",
+        "reverse",
+        "reverse_key",
+        "reverse_field_key",
+        "reverse_label",
+    )
+
     def __init__(
         self,
         *,
@@ -726,6 +784,8 @@ class BadgeSpec:
     This is a configuration element, with no effect on the search index schema.
     """
 
+    __slots__ = ("key", "field", "activator", "renderer", "weight")
+
     def __init__(
         self,
         key,
@@ -784,6 +844,8 @@ class PageSpec:
     Specifies a page whose content is to be extracted from a Zotero note.
     """
 
+    __slots__ = ("path", "item_id", "title")
+
     def __init__(self, path: str, item_id: str, title: str):
         self.path = path
         self.item_id = item_id
@@ -791,6 +853,8 @@ class PageSpec:
 
 
 class LinkSpec(ABC):
+    __slots__ = ("text", "new_window", "weight")
+
     def __init__(self, *, text: str, new_window=False, weight=0):
         self.text = text
         self.new_window = new_window
@@ -806,6 +870,8 @@ class LinkSpec(ABC):
 
 
 class LinkByURLSpec(LinkSpec):
+    __slots__ = ("_url",)
+
     def __init__(self, *, url: str, **kwargs):
         super().__init__(**kwargs)
         self._url = url
@@ -816,6 +882,8 @@ class LinkByURLSpec(LinkSpec):
 
 
 class LinkByEndpointSpec(LinkSpec):
+    __slots__ = ("endpoint", "external", "anchor", "scheme", "parameters")
+
     def __init__(
         self,
         *,
@@ -848,6 +916,8 @@ class LinkByEndpointSpec(LinkSpec):
 
 
 class PageLinkSpec(LinkSpec):
+    __slots__ = ("endpoint",)
+
     def __init__(self, *, page: str, **kwargs):
         super().__init__(**kwargs)
         self.endpoint = f"kerko.{page}"
@@ -861,6 +931,8 @@ class PageLinkSpec(LinkSpec):
 
 
 class LinkGroupSpec:
+    __slots__ = ("key", "links")
+
     def __init__(self, key: str, links: Optional[List[LinkSpec]] = None):
         self.key = key
         self.links = links or []
@@ -1,8 +1,11 @@
+import os
 import pathlib
 import pickle
 import shutil
+import time
 
 import whoosh
+from flask import current_app
 
 from kerko.shortcuts import data_path
 
@@ -72,9 +75,33 @@ def open_index(storage, *, write=False, schema=None, auto_create=False):
         raise SearchIndexError(msg) from e
 
 
+def _remove_dir(storage, path):
+    try:
+        shutil.rmtree(path)
+    except FileNotFoundError:
+        pass  # Already removed by a concurrent deletion.
+    except OSError as e:
+        current_app.logger.error(f"Could not delete {storage}: {e}. Leftover directory: '{path}'.")
+        raise
+
+
 def delete_storage(storage):
-    if (get_storage_dir(storage)).is_dir():
-        shutil.rmtree(get_storage_dir(storage))
+    storage_dir = get_storage_dir(storage)
+    # Remove any directories left over by previous deletions that have failed.
+    for leftover_dir in storage_dir.parent.glob(f"{storage_dir.name}.old.*"):
+        _remove_dir(storage, leftover_dir)
+    if not storage_dir.is_dir():
+        return
+    # Move the directory out of the way first. The rename is atomic, hence other
+    # processes either see the complete storage or no storage at all, never a
+    # partially deleted one. If the directory has already been claimed by a
+    # concurrent deletion, there is nothing left to do.
+    trash_dir = storage_dir.with_name(f"{storage_dir.name}.old.{os.getpid()}.{time.time_ns()}")
+    try:
+        storage_dir.rename(trash_dir)
+    except FileNotFoundError:
+        return
+    _remove_dir(storage, trash_dir)
 
 
 def get_doc_count(storage):
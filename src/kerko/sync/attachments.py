@@ -1,13 +1,14 @@
 """Download from Zotero the file attachments referenced by the cache."""
 
 import hashlib
+import os
 
 from flask import current_app
 
 from kerko.extractors import is_file_attachment
 from kerko.searcher import Searcher
 from kerko.shortcuts import composer, config
-from kerko.storage import get_storage_dir, open_index
+from kerko.storage import delete_storage, get_storage_dir, open_index
 from kerko.sync import zotero
 
 
@@ -23,6 +24,39 @@ def md5_checksum(path):
         return md5_hash.hexdigest()
 
 
+def get_mtime(path):
+    """Return the modification time of a file, in milliseconds as in Zotero."""
+    return path.stat().st_mtime_ns // 1_000_000
+
+
+def set_mtime(path, mtime):
+    """Set the modification time of a file, given in milliseconds as in Zotero."""
+    os.utime(path, ns=(mtime * 1_000_000, mtime * 1_000_000))
+
+
+def is_file_unchanged(path, data):
+    """
+    Return `True` if a local file matches the given Zotero attachment data.
+
+    As in Zotero's own file sync, a matching modification time is trusted
+    without reading the file. Otherwise, the file's checksum gets compared.
+    Without a checksum in the attachment data, the file is always considered
+    changed.
+
+    Note that a file modified locally without changing its modification time
+    (e.g., restored with its original timestamp) is considered unchanged, and
+    thus will not be downloaded again. Use a full sync to force the download of
+    all attachments.
+    """
+    md5 = data.get("md5")
+    if not md5:
+        return False
+    mtime = data.get("mtime")
+    if mtime and get_mtime(path) == mtime:
+        return True
+    return md5_checksum(path) == md5
+
+
 def sync_attachments(full=False):
     """
     Synchronize attachments from Zotero into the attachments directory.
@@ -40,30 +74,31 @@ def sync_attachments(full=False):
             return
         if not attachment["data"].get("md5"):
             current_app.logger.warning(f"Attachment {attachment['id']} lacks a checksum {context}.")
-        if attachment["id"] in local_files:
-            local_files.remove(attachment["id"])
-        filepath = attachments_dir / attachment["id"]
-        if (
-            full
-            or not filepath.exists()
-            or md5_checksum(filepath) != attachment["data"].get("md5", "")
-        ):
+        filepath = local_files.pop(attachment["id"], None) or attachments_dir / attachment["id"]
+        if full or not filepath.exists() or not is_file_unchanged(filepath, attachment["data"]):
             current_app.logger.debug(f"Requesting attachment {attachment['id']} {context}...")
             try:
                 # Download attachment.
                 with filepath.open("wb") as f:
                     f.write(zotero.retrieve_file(zotero_credentials, attachment["id"]))
+                if attachment["data"].get("mtime"):
+                    set_mtime(filepath, attachment["data"]["mtime"])
             except zotero.zotero_errors.PyZoteroError as e:
                 current_app.logger.error(
                     f"Could not download attachment {attachment['id']} {context}: {e}"
                 )
         else:
+            # After a checksum match, align the modification time with Zotero's so
+            # that the next sync may trust it without reading the file.
+            mtime = attachment["data"].get("mtime")
+            if mtime and get_mtime(filepath) != mtime:
+                set_mtime(filepath, mtime)
             current_app.logger.debug(f"Keeping attachment {attachment['id']} {context}.")
 
     current_app.logger.info("Starting attachment files sync...")
     attachments_dir = get_storage_dir("attachments")
     attachments_dir.mkdir(parents=True, exist_ok=True)
-    local_files = {p.name for p in attachments_dir.iterdir()}
+    local_files = {p.name: p for p in attachments_dir.iterdir()}
 
     # List all items from the search index and request their attachments, if
     # any, from Zotero
@@ -72,7 +107,7 @@ def sync_attachments(full=False):
     with Searcher(index) as searcher:
         count = 0
         results = searcher.search(limit=None)  # Retrieve all items.
-        for item in results.items(
+        for item in results.iter_items(
             composer().select_fields(["id", "item_type", "attachments", "data"])
         ):
             if item["item_type"] == "attachment" and is_file_attachment(
@@ -89,17 +124,13 @@ def sync_attachments(full=False):
                     count += 1
 
     # Delete remaining local files that were not referenced by any item.
-    for name in local_files:
+    for name, filepath in local_files.items():
         current_app.logger.debug(f"Deleting attachment {name}, unused.")
-        (attachments_dir / name).unlink()
+        filepath.unlink()
 
     current_app.logger.info(f"Attachment files sync successful ({count} file(s) processed).")
     return count
 
 
 def delete_attachments():
-    attachments_dir = get_storage_dir("attachments")
-    if attachments_dir.is_dir():
-        for filepath in attachments_dir.iterdir():
-            filepath.unlink()
-        attachments_dir.rmdir()
+    delete_storage("attachments")
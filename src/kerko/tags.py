@@ -11,34 +11,34 @@ class TagGate:
         """
         Initialize the instance.
 
-        :param [str,list] include_re: Regular expression pattern to use to
-            include objects based on their tags. Any object which does not have
-            a tag that matches this pattern will be excluded. If empty (which is
-            the default), all objects will be included unless the `exclude_re`
-            argument is set and causes some to be excluded. When passing a list,
-            every pattern of the list must match at least a tag for the object
-            to be included.
+        :param [str,Pattern,list] include_re: Regular expression pattern to use
+            to include objects based on their tags. Any object which does not
+            have a tag that matches this pattern will be excluded. If empty
+            (which is the default), all objects will be included unless the
+            `exclude_re` argument is set and causes some to be excluded. When
+            passing a list, every pattern of the list must match at least a tag
+            for the object to be included.
 
-        :param [str,list] exclude_re: Regular expression pattern to use to
-            exclude objects based on their tags. Any object that have a tag that
-            matches this pattern will be excluded. If empty (which is the
+        :param [str,Pattern,list] exclude_re: Regular expression pattern to use
+            to exclude objects based on their tags. Any object that have a tag
+            that matches this pattern will be excluded. If empty (which is the
             default), no objects will be excluded unless the `include_re`
             argument is set, in which case items that don't have any tag that
             matches it will be excluded. When passing a list, every pattern of
             the list must match at least a tag for the object to be excluded.
         """
         if include_re:
-            assert isinstance(include_re, Iterable)
-            if isinstance(include_re, str):
+            if isinstance(include_re, (str, re.Pattern)):
                 include_re = [include_re]
+            assert isinstance(include_re, Iterable)
             self.include_re = [re.compile(pattern) for pattern in include_re]
         else:
             self.include_re = None
 
         if exclude_re:
-            assert isinstance(exclude_re, Iterable)
-            if isinstance(exclude_re, str):
+            if isinstance(exclude_re, (str, re.Pattern)):
                 exclude_re = [exclude_re]
+            assert isinstance(exclude_re, Iterable)
             self.exclude_re = [re.compile(pattern) for pattern in exclude_re]
         else:
             self.exclude_re = None
@@ -10,7 +10,8 @@ def find(regex, flags=0, group=1, max_matches=1, iterate=False):
     """
     Return a callable that finds all non-overlapping matches in a given string.
 
-    :param str regex: Regular expression to search.
+    :param [str,Pattern] regex: Regular expression to search. It may be
+        passed already compiled, in which case `flags` must be left unset.
 
     :param int flags: Flags controlling the regular expression's behavior.
 
@@ -0,0 +1,57 @@
+"""
+Unit tests for the attachments synchronization module.
+"""
+
+import hashlib
+import pathlib
+import tempfile
+import unittest
+
+from kerko.sync.attachments import get_mtime, is_file_unchanged, set_mtime
+
+
+class IsFileUnchangedTestCase(unittest.TestCase):
+    """Test the `is_file_unchanged()` function."""
+
+    MTIME = 1_600_000_000_000  # In milliseconds, as in Zotero.
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = pathlib.Path(self.temp_dir.name) / "ABCD1234"
+        self.path.write_bytes(b"content")
+        self.md5 = hashlib.md5(b"content").hexdigest()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_set_mtime(self):
+        set_mtime(self.path, self.MTIME)
+        self.assertEqual(get_mtime(self.path), self.MTIME)
+
+    def test_mtime_match_skips_checksum(self):
+        set_mtime(self.path, self.MTIME)
+        # The checksum is wrong, but is not checked since the mtime matches.
+        self.assertTrue(is_file_unchanged(self.path, {"mtime": self.MTIME, "md5": "wrong"}))
+
+    def test_mtime_mismatch_checksum_match(self):
+        set_mtime(self.path, self.MTIME - 1000)
+        self.assertTrue(is_file_unchanged(self.path, {"mtime": self.MTIME, "md5": self.md5}))
+        # The check does not write to the file.
+        self.assertEqual(get_mtime(self.path), self.MTIME - 1000)
+
+    def test_mtime_mismatch_checksum_mismatch(self):
+        set_mtime(self.path, self.MTIME - 1000)
+        self.assertFalse(is_file_unchanged(self.path, {"mtime": self.MTIME, "md5": "wrong"}))
+
+    def test_no_mtime_checksum_match(self):
+        self.assertTrue(is_file_unchanged(self.path, {"md5": self.md5}))
+
+    def test_no_mtime_checksum_mismatch(self):
+        self.assertFalse(is_file_unchanged(self.path, {"md5": "wrong"}))
+
+    def test_mtime_match_no_checksum(self):
+        set_mtime(self.path, self.MTIME)
+        self.assertFalse(is_file_unchanged(self.path, {"mtime": self.MTIME}))
+
+    def test_no_mtime_no_checksum(self):
+        self.assertFalse(is_file_unchanged(self.path, {}))
@@ -2,6 +2,7 @@
 Unit tests for the tags module.
 """
 
+import re
 import unittest
 
 from kerko.tags import TagGate
@@ -128,6 +129,19 @@ class TagGateTestCase(unittest.TestCase):
         self.assertFalse(gate.check(self.objects[8]))
         self.assertTrue(gate.check(self.objects[9]))
 
+    def test_match_include_compiled(self):
+        gate = TagGate(include_re=re.compile(r"^_include$"))
+        self.assertTrue(gate.check(self.objects[0]))
+        self.assertTrue(gate.check(self.objects[1]))
+        self.assertFalse(gate.check(self.objects[2]))
+        self.assertFalse(gate.check(self.objects[3]))
+        self.assertTrue(gate.check(self.objects[4]))
+        self.assertFalse(gate.check(self.objects[5]))
+        self.assertFalse(gate.check(self.objects[6]))
+        self.assertFalse(gate.check(self.objects[7]))
+        self.assertFalse(gate.check(self.objects[8]))
+        self.assertFalse(gate.check(self.objects[9]))
+
     def test_match_include_multiple_tags(self):
         gate = TagGate(include_re=[r"^_include1$", r"^_include2$", r"^_include3$"])
         self.assertFalse(gate.check(self.objects[0]))
@@ -167,6 +181,19 @@ class TagGateTestCase(unittest.TestCase):
         self.assertFalse(gate.check(self.objects[8]))
         self.assertFalse(gate.check(self.objects[9]))
 
+    def test_match_exclude_compiled(self):
+        gate = TagGate(exclude_re=re.compile(r"^_exclude$"))
+        self.assertTrue(gate.check(self.objects[0]))
+        self.assertTrue(gate.check(self.objects[1]))
+        self.assertFalse(gate.check(self.objects[2]))
+        self.assertFalse(gate.check(self.objects[3]))
+        self.assertFalse(gate.check(self.objects[4]))
+        self.assertTrue(gate.check(self.objects[5]))
+        self.assertTrue(gate.check(self.objects[6]))
+        self.assertTrue(gate.check(self.objects[7]))
+        self.assertTrue(gate.check(self.objects[8]))
+        self.assertTrue(gate.check(self.objects[9]))
+
     def test_match_exclude_multiple_tags(self):
         gate = TagGate(exclude_re=[r"^_exclude1$", r"^_exclude2$"])
         self.assertTrue(gate.check(self.objects[0]))